@@ -2,14 +2,32 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import collections
 import datetime
+import functools
 import logging
 import struct
 import time
 from dataclasses import dataclass
 from enum import IntEnum
 from types import TracebackType
-from typing import Any, AsyncGenerator, Optional, Sequence, Type, TypeVar, overload
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import bleak
 from bleak.backends.characteristic import BleakGATTCharacteristic
@@ -70,26 +88,67 @@ class SendPacket(abc.ABC):
 
 R = TypeVar("R", bound="RecvPacket")
 
+# Received packets are unpacked from any of these, including views of the
+# receive buffer
+_Buffer = Union[bytes, bytearray, memoryview]
+
 
 class RecvPacket:
     RECV_COMMAND: Command
 
     @classmethod
     @abc.abstractmethod
-    def unpack(cls: Type[R], data: bytes) -> R:
+    def unpack(cls: Type[R], data: _Buffer) -> R:
         pass
 
+    @classmethod
+    def unpack_from(cls: Type[R], buffer: _Buffer, offset: int, length: int) -> R:
+        """
+        Unpack a packet whose data starts at `offset` in `buffer`. Fixed-width
+        packets override this to read straight from the buffer without slicing.
+        """
+        return cls.unpack(buffer[offset : offset + length])
+
+
+S = TypeVar("S", bound="_StructRecvPacket")
+
+
+class _StructRecvPacket(RecvPacket):
+    """
+    Fixed-width packet whose fields are unpacked in order by `_STRUCT`.
+    """
+
+    _STRUCT: struct.Struct
+
+    @classmethod
+    def unpack(cls: Type[S], data: _Buffer) -> S:
+        return cls.unpack_from(data, 0, len(data))
+
+    @classmethod
+    def unpack_from(cls: Type[S], buffer: _Buffer, offset: int, length: int) -> S:
+        return cls(*cls._unpack_fields(buffer, offset, length))
+
+    @classmethod
+    def _unpack_fields(cls, buffer: _Buffer, offset: int, length: int) -> Tuple[Any, ...]:
+        # The buffer can extend past the packet, so check the packet itself is
+        # long enough. Some packets have extra data at the end, which is ignored.
+        if length < cls._STRUCT.size:
+            raise struct.error(f"unpack requires a buffer of {cls._STRUCT.size} bytes")
+        return cls._STRUCT.unpack_from(buffer, offset)
+
 
-_PACKET_DATABASE = dict()
+# Indexed directly by the command byte of a received packet
+_PACKET_TABLE: List[Optional[Type[RecvPacket]]] = [None] * 256
 
 
 def _register_packet(packet_type: Type[RecvPacket]) -> None:
-    _PACKET_DATABASE[packet_type.RECV_COMMAND] = packet_type
+    _PACKET_TABLE[packet_type.RECV_COMMAND] = packet_type
 
 
 @dataclass
-class Measurement(RecvPacket):
+class Measurement(_StructRecvPacket):
     RECV_COMMAND = Command.MEAS_QUERY
+    _STRUCT = struct.Struct("<fffHH")
 
     read_value: float
     day_value: float
@@ -97,17 +156,14 @@ class Measurement(RecvPacket):
     pulse_count: int
     pulse_count_10_min: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> Measurement:
-        return cls(*struct.unpack("<fffHH", data))
-
 
 _register_packet(Measurement)
 
 
 @dataclass
-class Status(RecvPacket):
+class Status(_StructRecvPacket):
     RECV_COMMAND = Command.BLE_STATUS_QUERY
+    _STRUCT = struct.Struct("<BBIIf")
 
     device_status: int
     vib_status: int
@@ -115,10 +171,6 @@ class Status(RecvPacket):
     dc_value: int
     peak_value: float
 
-    @classmethod
-    def unpack(cls, data: bytes) -> Status:
-        return cls(*struct.unpack("<BBIIf", data))
-
 
 _register_packet(Status)
 
@@ -126,6 +178,7 @@ _register_packet(Status)
 @dataclass
 class DateTimeSet(SendPacket):
     SEND_COMMAND = Command.BLE_RD200_DATE_TIME_SET
+    _STRUCT = struct.Struct("<6B")
 
     year: int
     month: int
@@ -135,7 +188,9 @@ class DateTimeSet(SendPacket):
     second: int
 
     def pack(self) -> bytes:
-        return bytes((self.year, self.month, self.day, self.hour, self.minute, self.second))
+        return self._STRUCT.pack(
+            self.year, self.month, self.day, self.hour, self.minute, self.second
+        )
 
 
 @dataclass
@@ -156,9 +211,9 @@ class Serial(RecvPacket):
     serial: str
 
     @classmethod
-    def unpack(cls, data: bytes) -> Serial:
-        date = data[:8].decode("utf-8")
-        serial = data[8:].decode("utf-8")
+    def unpack(cls, data: _Buffer) -> Serial:
+        date = str(data[:8], "utf-8")
+        serial = str(data[8:], "utf-8")
         return cls(date, serial)
 
 
@@ -172,8 +227,8 @@ class SNType(RecvPacket):
     type: str
 
     @classmethod
-    def unpack(cls, data: bytes) -> SNType:
-        return cls(data[:3].decode("utf-8"))
+    def unpack(cls, data: _Buffer) -> SNType:
+        return cls(str(data[:3], "utf-8"))
 
 
 _register_packet(SNType)
@@ -190,8 +245,8 @@ class ModelName(RecvPacket):
     name: str
 
     @classmethod
-    def unpack(cls, data: bytes) -> ModelName:
-        return cls(data[0], data[1:].decode("utf-8"))
+    def unpack(cls, data: _Buffer) -> ModelName:
+        return cls(data[0], str(data[1:], "utf-8"))
 
 
 _register_packet(ModelName)
@@ -200,18 +255,24 @@ _register_packet(ModelName)
 @dataclass
 class AlarmSet(SendPacket):
     SEND_COMMAND = Command.BLE_WARNING_SET
+    _STRUCT = struct.Struct("<BfB")
 
     status: int
     value: float
     interval: int
 
     def pack(self) -> bytes:
-        return struct.pack("<BfB", self.status, self.value, self.interval)
+        return self._STRUCT.pack(self.status, self.value, self.interval)
 
 
 @dataclass
-class Config(RecvPacket):
+class Config(_StructRecvPacket):
     RECV_COMMAND = Command.CONFIG_QUERY
+    _STRUCT = struct.Struct("<BBfB")
+    # Plain lookups are much cheaper than calling the enum classes. Misses fall
+    # back to the enum classes, which raise a ValueError naming the enum.
+    _UNITS = {unit.value: unit for unit in Unit}
+    _ALARM_INTERVALS = {interval.value: interval for interval in AlarmInterval}
 
     unit: Unit
     alarm_status: int
@@ -219,26 +280,24 @@ class Config(RecvPacket):
     alarm_interval: AlarmInterval
 
     @classmethod
-    def unpack(cls, data: bytes) -> Config:
-        fields = struct.unpack("<BBfB", data)
-        unit = Unit(fields[0])
-        interval = AlarmInterval(fields[3])
-        return cls(unit, fields[1], fields[2], interval)
+    def unpack_from(cls, buffer: _Buffer, offset: int, length: int) -> Config:
+        unit, alarm_status, alarm_value, interval = cls._unpack_fields(buffer, offset, length)
+        try:
+            return cls(cls._UNITS[unit], alarm_status, alarm_value, cls._ALARM_INTERVALS[interval])
+        except KeyError:
+            return cls(Unit(unit), alarm_status, alarm_value, AlarmInterval(interval))
 
 
 _register_packet(Config)
 
 
 @dataclass
-class OLEDConfig(RecvPacket):
+class OLEDConfig(_StructRecvPacket):
     RECV_COMMAND = Command.OLED_QUERY
+    _STRUCT = struct.Struct("<I")
 
     value: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> OLEDConfig:
-        return cls(*struct.unpack("<I", data))
-
 
 _register_packet(OLEDConfig)
 
@@ -246,15 +305,16 @@ _register_packet(OLEDConfig)
 @dataclass
 class FirmwareInfo(RecvPacket):
     RECV_COMMAND = Command.BLE_VERSION_QUERY
+    _STATUS_STRUCT = struct.Struct("<I")
 
     version: str
     status: int
 
     @classmethod
-    def unpack(cls, data: bytes) -> FirmwareInfo:
-        version = data[:64].decode("utf-8")
-        if len(data) >= 64 + 4:
-            status = int.from_bytes(data[64 : 64 + 4], byteorder="little")
+    def unpack(cls, data: _Buffer) -> FirmwareInfo:
+        version = str(data[:64], "utf-8")
+        if len(data) >= 64 + cls._STATUS_STRUCT.size:
+            (status,) = cls._STATUS_STRUCT.unpack_from(data, 64)
         else:
             status = 0
         return cls(version, status)
@@ -264,79 +324,64 @@ _register_packet(FirmwareInfo)
 
 
 @dataclass
-class ModuleConfig(RecvPacket):
+class ModuleConfig(_StructRecvPacket):
     RECV_COMMAND = Command.MOD_CONFIG_QUERY
+    _STRUCT = struct.Struct("<BIIf")
 
     device_type: int
     sn_date: int
     sn_no: int
     factor: float
 
-    @classmethod
-    def unpack(cls, data: bytes) -> ModuleConfig:
-        return cls(*struct.unpack("<BIIf", data))
-
 
 _register_packet(ModuleConfig)
 
 
 @dataclass
-class ModuleProtection(RecvPacket):
+class ModuleProtection(_StructRecvPacket):
     RECV_COMMAND = Command.MOD_PROTECTION_RETURN
+    _STRUCT = struct.Struct("<II")
 
     protection_status: int
     operation_status: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> ModuleProtection:
-        return cls(*struct.unpack("<II", data))
-
 
 _register_packet(ModuleProtection)
 
 
 @dataclass
-class DisplayCalFactor(RecvPacket):
+class DisplayCalFactor(_StructRecvPacket):
     RECV_COMMAND = Command.DISPLAY_CAL_FACTOR_QUERY
+    _STRUCT = struct.Struct("<f")
 
     factor: float
 
-    @classmethod
-    def unpack(cls, data: bytes) -> DisplayCalFactor:
-        return cls(*struct.unpack("<f", data))
-
 
 _register_packet(DisplayCalFactor)
 
 
 @dataclass
-class ProductProcessMode(RecvPacket):
+class ProductProcessMode(_StructRecvPacket):
     RECV_COMMAND = Command.PRODUCT_PROCESS_MODE_QUERY
+    _STRUCT = struct.Struct("<BBH")
 
     on_off: int
     time_hour: int
     bq: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> ProductProcessMode:
-        return cls(*struct.unpack("<BBH", data))
-
 
 _register_packet(ProductProcessMode)
 
 
 @dataclass
-class LogInfo(RecvPacket):
+class LogInfo(_StructRecvPacket):
     RECV_COMMAND = Command.EEPROM_LOG_INFO_QUERY
+    # Unknown extra data at the end
+    _STRUCT = struct.Struct("<Hb")
 
     data_no: int
     checksum: int
 
-    @staticmethod
-    def unpack(data: bytes) -> LogInfo:
-        # Unknown extra data at the end
-        return LogInfo(*struct.unpack("<Hb", data[:3]))
-
 
 _register_packet(LogInfo)
 
@@ -363,12 +408,36 @@ class RD200:
         if adapter is not None:
             kwargs.update(adapter=adapter)
 
-        self.device = bleak.BleakClient(device, **kwargs)
+        # Still call any disconnect callback supplied by the caller
+        self._disconnected_callback = kwargs.pop("disconnected_callback", None)
+        self.device = bleak.BleakClient(device, disconnected_callback=self._on_disconnect, **kwargs)
+        # Updated by the disconnect callback, so checking it doesn't need to
+        # query the backend
+        self._connected = False
 
         self._ctl: Optional[BleakGATTCharacteristic] = None
         self._meas: Optional[BleakGATTCharacteristic] = None
         self._log: Optional[BleakGATTCharacteristic] = None
 
+        # Client method bound to the control characteristic on connect, so the
+        # request paths don't need to resolve it again for every packet
+        self._write_ctl: Optional[Callable[[bytes], Awaitable[None]]] = None
+
+        # Futures waiting for a packet on the measurement characteristic, keyed
+        # by the command byte of the expected packet, or None to accept any.
+        # Concurrent requests for the same packet are resolved in order.
+        self._pending: Dict[Optional[int], Deque[asyncio.Future[bytearray]]] = {}
+        # Receives log data notifications while get_log() is running, which
+        # waits for the transfer to complete on _log_done
+        self._log_receiver: Optional[Callable[[bytearray], None]] = None
+        self._log_done: Optional[asyncio.Future[None]] = None
+        # Characteristics with notifications enabled
+        self._notifying: List[BleakGATTCharacteristic] = []
+
+        # Fixed device information, cached for the current connection
+        self._serial: Optional[Serial] = None
+        self._model_name: Optional[str] = None
+
     async def __aenter__(self) -> "RD200":
         await self.connect()
         return self
@@ -378,8 +447,8 @@ class RD200:
         exc_type: Optional[Type[BaseException]],
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
-    ) -> bool:
-        return await self.disconnect()
+    ) -> None:
+        await self.disconnect()
 
     @classmethod
     async def discover(
@@ -391,6 +460,9 @@ class RD200:
         """
 
         device_queue: asyncio.Queue[BLEDevice] = asyncio.Queue()
+        # Devices advertise continuously, so only queue (and wake up the
+        # generator for) each one the first time it is seen
+        seen_addresses: Set[str] = set()
 
         def detection_callback(d: BLEDevice, ad: Optional[AdvertisementData]) -> None:
             if "uuids" in d.metadata:
@@ -399,7 +471,8 @@ class RD200:
                 uuids = ad.service_uuids
             else:
                 return
-            if RD200.LBS_UUID_SERVICE in uuids:
+            if RD200.LBS_UUID_SERVICE in uuids and d.address not in seen_addresses:
+                seen_addresses.add(d.address)
                 device_queue.put_nowait(d)
 
         # Can't pass adapter=None to BleakScanner
@@ -423,12 +496,15 @@ class RD200:
     @property
     def connected(self) -> bool:
         """Indicate whether the remote device is currently connected."""
-        return self.device.is_connected
+        return self._connected
 
     async def connect(self) -> bool:
         """
         Connect to the RadonEye device.
         """
+        self._serial = None
+        self._model_name = None
+
         if not await self.device.connect():
             return False
 
@@ -443,15 +519,44 @@ class RD200:
         if self._ctl is None or self._meas is None or self._log is None:
             await self.disconnect()
             return False
+
+        self._write_ctl = functools.partial(self.device.write_gatt_char, self._ctl)
+        # disconnect() only stops notifications while connected
+        self._connected = True
+        try:
+            # Stay subscribed for the whole connection rather than enabling
+            # notifications around each request, which costs two extra round trips
+            await self.device.start_notify(self._meas, self._meas_callback)
+            self._notifying.append(self._meas)
+        except BaseException:
+            await self.disconnect()
+            raise
+
         return True
 
     async def disconnect(self) -> bool:
         """
         Disconnect from the RadonEye device.
         """
+        # Notifications are gone anyway if the device disconnected on its own
+        if self._connected:
+            for characteristic in self._notifying:
+                try:
+                    # This can fail if the device disconnected in the meantime,
+                    # but we should ignore the error in this case
+                    await self.device.stop_notify(characteristic)
+                # All kinds of exceptions can be thrown after the device disconnects
+                except BaseException as e:
+                    _logger.warning("failed to stop notify", exc_info=e)
+        self._notifying.clear()
+
+        self._connected = False
+        self._fail_pending()
+
         self._ctl = None
         self._meas = None
         self._log = None
+        self._write_ctl = None
         return await self.device.disconnect()
 
     @property
@@ -466,14 +571,9 @@ class RD200:
         if date is None:
             date = datetime.datetime.now()
 
-        year = int(date.strftime("%y"))
-        month = int(date.strftime("%m"))
-        day = int(date.strftime("%d"))
-        hour = int(date.strftime("%H"))
-        minute = int(date.strftime("%M"))
-        second = int(date.strftime("%S"))
-
-        await self._send_packet(DateTimeSet(year, month, day, hour, minute, second))
+        await self._send_packet(
+            DateTimeSet(date.year % 100, date.month, date.day, date.hour, date.minute, date.second)
+        )
 
     @property
     async def unit(self) -> Unit:
@@ -516,7 +616,9 @@ class RD200:
 
     @property
     async def serial(self) -> Serial:
-        return await self._request_packet(Command.SN_QUERY, Serial)
+        if self._serial is None:
+            self._serial = await self._request_packet(Command.SN_QUERY, Serial)
+        return self._serial
 
     @property
     async def serial_type(self) -> str:
@@ -524,7 +626,11 @@ class RD200:
 
     @property
     async def model_name(self) -> str:
-        return (await self._request_packet(Command.MODEL_NAME_RETURN, ModelName)).name
+        if self._model_name is None:
+            self._model_name = (
+                await self._request_packet(Command.MODEL_NAME_RETURN, ModelName)
+            ).name
+        return self._model_name
 
     @property
     async def firmware_info(self) -> FirmwareInfo:
@@ -553,53 +659,63 @@ class RD200:
         return await self._request_packet(Command.EEPROM_LOG_INFO_QUERY, LogInfo)
 
     async def get_log(self, timeout: float = 10.0) -> Sequence[float]:
-        if not self._log:
+        if not self._log or not self._connected:
             raise NotConnectedError()
 
+        # Most connections never read the log, so only subscribe once it is
+        # first needed, and then stay subscribed until disconnecting
+        if self._log not in self._notifying:
+            await self.device.start_notify(self._log, self._log_callback)
+            self._notifying.append(self._log)
+
         log_info = await self.log_info
 
         log_buffer_len = log_info.data_no * 2
-        log_buffer_done = asyncio.Event()
-        log_buffer = bytearray()
-
-        def log_data_callback(_sender: Any, data: bytearray) -> None:
-            _logger.debug(f"<-- (LOG) {data.hex()}")
-            log_buffer.extend(data)
-            if len(log_buffer) >= log_buffer_len:
-                log_buffer_done.set()
-
-        await self.device.start_notify(self._log, log_data_callback)
-        await self._send_command(Command.EEPROM_LOG_DATA_SEND)
-        await asyncio.wait_for(log_buffer_done.wait(), timeout=timeout)
-        await self.device.stop_notify(self._log)
-
-        log_data = []
-        for i in range(log_info.data_no):
-            log_point_raw = int.from_bytes(log_buffer[i * 2 : i * 2 + 2], byteorder="little")
-            log_data.append(log_point_raw / 100.0)
+        log_buffer_done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        log_buffer = bytearray(log_buffer_len)
+        log_buffer_pos = 0
+
+        def log_data_callback(data: bytearray) -> None:
+            nonlocal log_buffer_pos
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("<-- (LOG) %s", data.hex())
+            end = log_buffer_pos + len(data)
+            log_buffer[log_buffer_pos:end] = data
+            log_buffer_pos = end
+            if log_buffer_pos >= log_buffer_len and not log_buffer_done.done():
+                log_buffer_done.set_result(None)
+
+        self._log_receiver = log_data_callback
+        self._log_done = log_buffer_done
+        try:
+            await self._send_command(Command.EEPROM_LOG_DATA_SEND)
+            await asyncio.wait_for(log_buffer_done, timeout=timeout)
+        finally:
+            self._log_receiver = None
+            self._log_done = None
 
-        return log_data
+        log_raw = struct.unpack_from(f"<{log_info.data_no}H", log_buffer)
+        return [log_point_raw / 100.0 for log_point_raw in log_raw]
 
     async def _send_command(self, command: Command) -> None:
-        if not self._ctl:
+        if self._write_ctl is None:
             raise NotConnectedError()
 
-        buffer = bytearray((command,))
-        _logger.debug(f"--> (CTL) {buffer.hex()}")
-        await self.device.write_gatt_char(self._ctl, buffer)
+        buffer = bytes((command,))
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("--> (CTL) %s", buffer.hex())
+        await self._write_ctl(buffer)
 
     async def _send_packet(self, packet: SendPacket) -> None:
-        if not self._ctl:
+        if self._write_ctl is None:
             raise NotConnectedError()
 
-        buffer = bytearray()
-        buffer.append(packet.SEND_COMMAND)
         data = packet.pack()
-        buffer.append(len(data))
-        buffer.extend(data)
-        _logger.debug(f"--> (CTL) {buffer.hex()}")
+        buffer = bytes((packet.SEND_COMMAND, len(data))) + data
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("--> (CTL) %s", buffer.hex())
 
-        await self.device.write_gatt_char(self._ctl, buffer)
+        await self._write_ctl(buffer)
 
     @overload
     async def _request_packet(
@@ -625,29 +741,15 @@ class RD200:
         response_type: Optional[Type[R]] = None,
         timeout: Optional[float] = None,
     ) -> RecvPacket:
-        if not self._meas:
-            raise NotConnectedError()
-
-        recv_future: asyncio.Future[bytearray] = asyncio.Future()
-
-        def meas_callback(_sender: Any, data: bytearray) -> None:
-            if not recv_future.done():
-                recv_future.set_result(data)
-            else:
-                _logger.warning("received more than one response")
-
-        await self.device.start_notify(self._meas, meas_callback)
+        # Some responses use a different command byte than their request, so
+        # wait for the one expected by the response type
+        response_command = response_type.RECV_COMMAND if response_type is not None else None
+        recv_future = self._expect_packet(response_command)
         try:
             await self._send_command(command)
             buffer = await asyncio.wait_for(recv_future, timeout)
         finally:
-            try:
-                # This can fail if the device disconnected, but we should
-                # ignore the error in this case
-                await self.device.stop_notify(self._meas)
-            # All kinds of exceptions can be thrown after the device disconnects
-            except BaseException as e:
-                _logger.warning("failed to stop notify", exc_info=e)
+            self._forget_packet(response_command, recv_future)
 
         return self._parse_packet(buffer)
 
@@ -664,21 +766,75 @@ class RD200:
     async def _recv_packet(
         self, packet_type: Optional[Type[R]] = None, timeout: Optional[float] = None
     ) -> RecvPacket:
-        if not self._meas:
-            raise NotConnectedError()
+        packet_command = packet_type.RECV_COMMAND if packet_type is not None else None
+        recv_future = self._expect_packet(packet_command)
+        try:
+            buffer = await asyncio.wait_for(recv_future, timeout)
+        finally:
+            self._forget_packet(packet_command, recv_future)
 
-        recv_future: asyncio.Future[bytearray] = asyncio.Future()
+        return self._parse_packet(buffer, packet_type)
 
-        def meas_callback(_sender: Any, data: bytearray) -> None:
-            recv_future.set_result(data)
+    def _expect_packet(self, command: Optional[int]) -> asyncio.Future[bytearray]:
+        """
+        Register a future to be resolved with the next packet received with the
+        given command byte, or with any packet if `command` is None.
+        """
+        if self._meas is None or not self._connected:
+            raise NotConnectedError()
 
-        try:
-            await self.device.start_notify(self._meas, meas_callback)
+        future: asyncio.Future[bytearray] = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(command, collections.deque()).append(future)
+        return future
+
+    def _fail_pending(self) -> None:
+        """Fail all requests waiting for a packet, because none will arrive"""
+        for waiters in self._pending.values():
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(NotConnectedError())
+        self._pending.clear()
+        if self._log_done is not None and not self._log_done.done():
+            self._log_done.set_exception(NotConnectedError())
+
+    def _on_disconnect(self, client: bleak.BleakClient) -> None:
+        _logger.debug("disconnected")
+        self._connected = False
+        self._fail_pending()
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(client)
+
+    def _forget_packet(self, command: Optional[int], future: asyncio.Future[bytearray]) -> None:
+        waiters = self._pending.get(command)
+        if waiters is not None and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._pending[command]
+
+    def _next_pending(self, command: Optional[int]) -> Optional[asyncio.Future[bytearray]]:
+        waiters = self._pending.get(command)
+        if not waiters:
+            return None
+        future = waiters.popleft()
+        if not waiters:
+            del self._pending[command]
+        return future
+
+    def _meas_callback(self, _sender: Any, data: bytearray) -> None:
+        future = self._next_pending(data[0])
+        if future is None:
+            future = self._next_pending(None)
+
+        if future is not None and not future.done():
+            future.set_result(data)
+        else:
+            _logger.warning("received unexpected packet: 0x%02x", data[0])
 
-            buffer = await asyncio.wait_for(recv_future, timeout)
-            return self._parse_packet(buffer, packet_type)
-        finally:
-            await self.device.stop_notify(self._meas)
+    def _log_callback(self, _sender: Any, data: bytearray) -> None:
+        if self._log_receiver is not None:
+            self._log_receiver(data)
+        else:
+            _logger.warning("received unexpected log data")
 
     @overload
     def _parse_packet(self, buffer: bytearray, packet_type: Type[R]) -> R:
@@ -691,8 +847,8 @@ class RD200:
     def _parse_packet(self, buffer: bytearray, packet_type: Optional[Type[R]] = None) -> RecvPacket:
         command = buffer[0]
         length = buffer[1]
-        data = buffer[2 : 2 + length]
-        _logger.debug(f"<-- (MEAS) {buffer[:2 + length].hex()}")
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("<-- (MEAS) %s", buffer[: 2 + length].hex())
 
         resolved_packet_type: Type[RecvPacket]
         if packet_type is not None:
@@ -700,6 +856,12 @@ class RD200:
                 raise TypeError("Wrong packet type received")
             resolved_packet_type = packet_type
         else:
-            resolved_packet_type = _PACKET_DATABASE[Command(command)]
-
-        return resolved_packet_type.unpack(data)
+            table_packet_type = _PACKET_TABLE[command]
+            if table_packet_type is None:
+                raise ValueError(f"Unknown packet type received: 0x{command:02x}")
+            resolved_packet_type = table_packet_type
+
+        # Slices of the view passed to variable-length packets don't copy the
+        # buffer, and their strings are decoded directly from it
+        with memoryview(buffer) as view:
+            return resolved_packet_type.unpack_from(view, 2, length)
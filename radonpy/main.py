@@ -6,9 +6,8 @@ import json
 import logging
 import ssl
 import sys
-import time
 import urllib.parse
-from typing import Mapping, MutableMapping, Optional, Tuple, Union
+from typing import List, Mapping, MutableMapping, Optional
 
 import aiohttp
 import aioinflux
@@ -97,23 +96,20 @@ async def run_influxdb_import_log(
 ) -> None:
     log = await device.get_log()
 
-    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    # The log has one point per hour, ending an hour before now
+    start = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(hours=len(log))
 
-    def map_point(
-        item: Tuple[int, float],
-    ) -> Mapping[str, Union[Mapping[str, float], Mapping[str, str], str, datetime.datetime]]:
-        i, value = item
-        delta = datetime.timedelta(hours=len(log) - i)
-        return {
-            "time": now - delta,
+    points = (
+        {
+            "time": start + datetime.timedelta(hours=i),
             "measurement": "radon",
             "tags": tags,
             "fields": {
                 "current_value": value,
             },
         }
-
-    points = map(map_point, enumerate(log))
+        for i, value in enumerate(log)
+    )
     await client.write(points)
 
 
@@ -123,26 +119,70 @@ async def run_influxdb_normal(
     client: aioinflux.InfluxDBClient,
     tags: Mapping[str, str],
 ) -> None:
-    next_time = time.time()
-    while True:
-        measurement = await device.measurement
-
-        fields = {
-            "current_value": measurement.read_value,
-            "day_value": measurement.day_value,
-            "month_value": measurement.month_value,
-            "pulse_count": measurement.pulse_count,
-            "pulse_count_10_min": measurement.pulse_count_10_min,
-        }
-        for field in args.exclude_field:
-            fields.pop(field, None)
-        try:
-            await client.write({"time": "", "measurement": "radon", "tags": tags, "fields": fields})
-        except (aioinflux.InfluxDBWriteError, aiohttp.ClientError) as e:
-            _logger.error("failed to write to InfluxDB", exc_info=e)
+    # Points waiting to be written in the next batch
+    points: List[Mapping[str, object]] = []
+
+    # The loop's monotonic clock isn't affected by system clock adjustments
+    loop = asyncio.get_running_loop()
+    next_time = loop.time()
+    # Loop time at which the first point of the current batch was collected
+    batch_start = next_time
+    try:
+        while True:
+            measurement = await device.measurement
+
+            fields = {
+                "current_value": measurement.read_value,
+                "day_value": measurement.day_value,
+                "month_value": measurement.month_value,
+                "pulse_count": measurement.pulse_count,
+                "pulse_count_10_min": measurement.pulse_count_10_min,
+            }
+            for field in args.exclude_field:
+                fields.pop(field, None)
+            if not points:
+                batch_start = loop.time()
+            points.append(
+                {
+                    "time": datetime.datetime.now(tz=datetime.timezone.utc),
+                    "measurement": "radon",
+                    "tags": tags,
+                    "fields": fields,
+                }
+            )
+            # Points are only written after a measurement, so the flush
+            # interval is effectively rounded up to the measurement interval
+            if len(points) >= args.batch_size or (
+                args.flush_interval is not None and loop.time() - batch_start >= args.flush_interval
+            ):
+                await write_influxdb_points(client, points)
+
+            next_time += args.interval
+            delay = next_time - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+    finally:
+        # Don't lose a partial batch when stopping
+        if points:
+            await write_influxdb_points(client, points)
+
+
+async def write_influxdb_points(
+    client: aioinflux.InfluxDBClient, points: List[Mapping[str, object]]
+) -> None:
+    """Write a batch of points in a single request and clear the batch"""
+    try:
+        await client.write(points)
+    except (aioinflux.InfluxDBWriteError, aiohttp.ClientError) as e:
+        _logger.error("failed to write to InfluxDB", exc_info=e)
+    points.clear()
+
 
-        next_time += args.interval
-        await asyncio.sleep(next_time - time.time())
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
 
 
 async def run() -> None:
@@ -175,6 +215,18 @@ async def run() -> None:
         default=[],
         help="Exclude a field from the InfluxDB measurement",
     )
+    influxdb_parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=1,
+        help="Number of measurements to collect before writing them to InfluxDB",
+    )
+    influxdb_parser.add_argument(
+        "--flush-interval",
+        type=float,
+        help="Maximum time in seconds to hold measurements before writing them to InfluxDB,"
+        " even if the batch isn't full",
+    )
     influxdb_parser.add_argument("--url", required=True, help="InfluxDB server URL")
     influxdb_parser.add_argument("--database", default="radoneye", help="InfluxDB database")
     influxdb_parser.add_argument("--username", default="radoneye", help="InfluxDB username")
@@ -216,4 +268,10 @@ async def run() -> None:
 
 
 def main() -> None:
-    asyncio.run(run())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run())
+    else:
+        # Cheaper event loop for the long running influxdb command
+        uvloop.run(run())